@@ -1,83 +1,198 @@
 import os
 import sys
 import asyncio
+import concurrent.futures
 import aiohttp
 import io
 import logging
+import random
+import threading
 import time
-import requests
-from datetime import datetime, timedelta
+import orjson
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
 from typing import Optional, Dict, Any, Tuple
 from zoneinfo import ZoneInfo
 
 # FastAPI imports
-from fastapi import FastAPI, Form, HTTPException, Request
-from fastapi.responses import HTMLResponse
-from starlette.responses import RedirectResponse
+from fastapi import FastAPI, Form, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse
+from fastapi.staticfiles import StaticFiles
+from starlette.responses import RedirectResponse, Response
 
 # Graph/Data external libraries
-import yfinance as yf
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-import matplotlib
-import numpy as np
-import pandas as pd
+# ⭐️ [수정] matplotlib/numpy는 차트 생성 시점에 lazy-import
+# (pyplot import만 수백 ms + 수십 MB RSS → Render Free Tier 콜드 스타트 지연 방지)
+# yfinance/pandas/requests는 Yahoo 차트 API + 순수 파이썬 파싱 전환 후 미사용.
+
+# Lazily-loaded module references (populated by _load_numpy / _load_plot_libs)
+plt = None
+mdates = None
+np = None
+PILImage = None
+
+
+def _load_numpy():
+    """numpy만 lazy-import 합니다. 웹 프로세스의 데이터 정렬 경로는 이것으로
+    충분하며, matplotlib/Pillow 전체 스택은 렌더 워커에서만 올라갑니다."""
+    global np
+    if np is None:
+        import numpy
+        np = numpy
+
+
+def _load_plot_libs():
+    """차트 생성에 필요한 무거운 라이브러리를 첫 호출 시에만 import 합니다.
+    이후 호출은 캐시된 모듈 참조를 재사용합니다. (렌더 워커 전용 —
+    웹 프로세스에서는 _load_numpy만 사용할 것)"""
+    global plt, mdates, PILImage
+    if plt is not None:
+        return
+
+    import matplotlib
+    # Set Matplotlib backend BEFORE pyplot import (required for headless server environment)
+    matplotlib.use('Agg')
+    import matplotlib.pyplot
+    import matplotlib.dates
+    from PIL import Image
+
+    _load_numpy()
+    plt = matplotlib.pyplot
+    mdates = matplotlib.dates
+    PILImage = Image
+
+
+_plot_worker_warmed = False
+
+
+def _init_plot_worker():
+    """렌더 워커 프로세스 초기화: import + 스타일 + 폰트 캐시 예열.
+
+    ⭐️ [수정] 스타일 적용(rc 리셋)은 프로세스당 1회면 충분하고,
+    더미 draw로 폰트 메트릭 캐시를 미리 채워 첫 실제 렌더의
+    100~500ms 초기화 비용을 없앱니다. _load_plot_libs가 아니라 여기에
+    두는 이유: 워커 전용 initializer라 웹 프로세스에서는 절대 실행되지
+    않음을 구조적으로 보장하기 위해서입니다."""
+    global _plot_worker_warmed
+    _load_plot_libs()
+    if _plot_worker_warmed:
+        return
+    plt.style.use('dark_background')
+    f = plt.figure()
+    f.text(0.5, 0.5, "warmup")
+    f.canvas.draw()
+    plt.close(f)
+    _plot_worker_warmed = True
 
 
-def get_usdt_and_exchange_rate() -> tuple[float, float, float]:
-    """USDT(업비트) 가격, 원-달러 환율(다음), 괴리율(%) 반환"""
-    테더원 = 0.0
-    달러원 = 0.0
-    달러테더괴리율 = 0.0
+# =========================================================
+# --- Shared aiohttp session (process-lifetime, pooled keep-alive) ---
+# =========================================================
+HTTP_SESSION: Optional[aiohttp.ClientSession] = None
+_daum_cookie_warmed = False
+
+
+async def _get_http_session() -> aiohttp.ClientSession:
+    """프로세스 전체에서 재사용하는 공유 aiohttp 세션을 반환합니다.
+    커넥션 풀 + keep-alive 덕분에 Telegram 등 반복 요청이 TCP/TLS
+    핸드셰이크를 다시 치르지 않습니다."""
+    global HTTP_SESSION
+    if HTTP_SESSION is None or HTTP_SESSION.closed:
+        HTTP_SESSION = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=64,
+                limit_per_host=16,
+                ttl_dns_cache=300,
+            )
+        )
+    return HTTP_SESSION
+
+
+async def close_http_session():
+    """FastAPI shutdown 시 공유 세션을 정리합니다."""
+    global HTTP_SESSION
+    if HTTP_SESSION is not None and not HTTP_SESSION.closed:
+        await HTTP_SESSION.close()
+    HTTP_SESSION = None
+
 
-    # === 달러-원 환율 (Daum 금융) ===
+async def _ensure_daum_cookies(session: aiohttp.ClientSession):
+    """Daum 금융 API용 세션 쿠키를 프로세스당 1회만 확보합니다."""
+    global _daum_cookie_warmed
+    if _daum_cookie_warmed:
+        return
     try:
-        url = "https://finance.daum.net/api/exchanges/FRX.KRWUSD"
-        headers = {
-            "User-Agent": (
-                "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-                "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-            ),
-            "Accept": "application/json, text/plain, */*",
-            "Referer": "https://finance.daum.net/",
-        }
-
-        s = requests.Session()
-        s.headers.update(headers)
-        # 메인 페이지 방문해 세션 쿠키 확보
-        try:
-            s.get("https://finance.daum.net/", timeout=5)
-        except:
+        async with session.get("https://finance.daum.net/", headers=DAUM_HEADERS,
+                               timeout=aiohttp.ClientTimeout(total=5)):
             pass
+    except:
+        pass
+    _daum_cookie_warmed = True
+
+
+DAUM_FX_URL = "https://finance.daum.net/api/exchanges/FRX.KRWUSD"
+DAUM_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "application/json, text/plain, */*",
+    "Referer": "https://finance.daum.net/",
+}
+
+
+async def _fetch_daum_fx(session: aiohttp.ClientSession) -> float:
+    """달러-원 환율 (Daum 금융)을 비동기로 가져옵니다. 오류 시 0.0 반환."""
+    달러원 = 0.0
+    try:
+        # 메인 페이지 방문해 세션 쿠키 확보 (프로세스당 1회)
+        await _ensure_daum_cookies(session)
 
         for _ in range(2):  # 403 등 발생 시 2회 재시도
             try:
-                resp = s.get(url, timeout=5)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    base_price = data.get("basePrice")
-                    if base_price is not None:
-                        달러원 = float(base_price)
-                    break
-                elif resp.status_code == 403:
-                    time.sleep(1)
+                async with session.get(DAUM_FX_URL, headers=DAUM_HEADERS,
+                                       timeout=aiohttp.ClientTimeout(total=5)) as resp:
+                    if resp.status == 200:
+                        data = orjson.loads(await resp.read())
+                        base_price = data.get("basePrice")
+                        if base_price is not None:
+                            달러원 = float(base_price)
+                        break
+                    elif resp.status == 403:
+                        await asyncio.sleep(1)
             except:
-                time.sleep(0.5)
+                await asyncio.sleep(0.5)
     except:
         달러원 = 0.0
+    return 달러원
+
 
-    # === 업비트 USDT 가격 ===
+async def _fetch_upbit_usdt(session: aiohttp.ClientSession) -> float:
+    """업비트 USDT 가격을 비동기로 가져옵니다. 오류 시 0.0 반환."""
     try:
-        resp = requests.get("https://api.upbit.com/v1/ticker?markets=KRW-USDT", timeout=5).json()
-        테더원 = float(resp[0]["trade_price"])
-        time.sleep(1)
+        async with session.get("https://api.upbit.com/v1/ticker?markets=KRW-USDT",
+                               timeout=aiohttp.ClientTimeout(total=5)) as resp:
+            data = orjson.loads(await resp.read())
+            return float(data[0]["trade_price"])
     except:
-        테더원 = 0.0
+        return 0.0
+
+
+async def get_usdt_and_exchange_rate() -> tuple[float, float, float]:
+    """USDT(업비트) 가격, 원-달러 환율(다음), 괴리율(%) 반환.
+    두 요청은 asyncio.gather로 동시에 실행됩니다."""
+    session = await _get_http_session()
+    달러원, 테더원 = await asyncio.gather(
+        _fetch_daum_fx(session),
+        _fetch_upbit_usdt(session),
+    )
+    달러테더괴리율 = 0.0
 
     # === 달러-테더 괴리율 계산 ===
     try:
         if 달러원 and 테더원:
-            달러테더괴리율 = round((테더원 / 달러원 - 1) * 100, 2)
+            # 🚨 개선: round() 제거 — 캡션의 {:.2f} 포맷이 이미 양자화함
+            달러테더괴리율 = (테더원 / 달러원 - 1) * 100
     except ZeroDivisionError:
         달러테더괴리율 = 0.0
 
@@ -92,73 +207,79 @@ class GoldKimpAnalyzer:
     def __init__(self, api_url: str = API_URL):
         self.api_url = api_url
 
-    def _fetch_data(self):
-        """API에서 데이터를 가져오고 JSON 형식으로 반환합니다."""
+    async def _fetch_data(self):
+        """API에서 데이터를 비동기로 가져오고 JSON 형식으로 반환합니다."""
         try:
             logging.info("골드 김프 API 데이터 요청 중...")
-            resp = requests.get(self.api_url, timeout=10)
-            resp.raise_for_status()
-            data = resp.json()
+            session = await _get_http_session()
+            async with session.get(self.api_url, timeout=aiohttp.ClientTimeout(total=10)) as resp:
+                resp.raise_for_status()
+                data = orjson.loads(await resp.read())
             if not data.get("rows"):
                 logging.warning("API 응답에 'rows' 데이터가 비어있습니다.")
                 return None
             logging.info("데이터 가져오기 성공.")
             return data
-        except requests.exceptions.RequestException as e:
-            logging.error(f"API 요청 오류 발생: {e}")
+        except aiohttp.ClientError as e:
+            logging.error("API 요청 오류 발생: %s", e)
             return None
         except Exception as e:
-            logging.error(f"데이터 파싱 중 예상치 못한 오류 발생: {e}")
+            logging.error("데이터 파싱 중 예상치 못한 오류 발생: %s", e)
             return None
 
     def _calculate_metrics(self, data):
-        """가져온 데이터를 기반으로 KRX 가격, 국제 가격, 김프를 계산합니다."""
+        """가져온 데이터를 기반으로 KRX 가격, 국제 가격, 김프를 계산합니다.
+
+        🚨 개선: 전체 히스토리를 DataFrame으로 만들지 않고, 가장 최근의
+        유효한 행 하나만 순수 파이썬으로 파싱합니다. (결과는 마지막 행만
+        쓰므로 행 수에 무관하게 일정한 비용)
+        """
         if data is None:
             return None
-            
+
         try:
-            df = pd.DataFrame(data.get("rows", []))
-            
-            # 1. 데이터 클리닝 및 인덱스 설정
-            df['time'] = pd.to_datetime(df['time'], format='%y/%m/%d %H:%M', errors='coerce')
-            df.set_index('time', inplace=True)
-            df.sort_index(inplace=True)
-
-            # 2. 숫자형 변환 및 결측치 제거
-            df['xauusd_oz'] = pd.to_numeric(df['xauusd_oz'], errors='coerce')
-            df['usdkrw'] = pd.to_numeric(df['usdkrw'], errors='coerce')
-            df['krxkrw_g'] = pd.to_numeric(df['krxkrw_g'], errors='coerce')
-            df.dropna(subset=['xauusd_oz', 'usdkrw', 'krxkrw_g'], inplace=True)
-            
-            if df.empty:
+            # 시간 기준으로 가장 최근의 유효한 행을 찾습니다.
+            latest_time = None
+            latest_row = None
+            for row in data.get("rows", []):
+                try:
+                    row_time = datetime.strptime(row['time'], '%y/%m/%d %H:%M')
+                    xauusd_oz = float(row['xauusd_oz'])
+                    usdkrw = float(row['usdkrw'])
+                    krxkrw_g = float(row['krxkrw_g'])
+                except (KeyError, TypeError, ValueError):
+                    continue  # 결측/비정상 행은 건너뜀
+                if latest_time is None or row_time > latest_time:
+                    latest_time = row_time
+                    latest_row = (xauusd_oz, usdkrw, krxkrw_g)
+
+            if latest_row is None:
                 logging.warning("데이터 클리닝 후 유효한 행이 남아있지 않습니다.")
                 return None
 
-            # 3. 계산 로직
+            xauusd_oz, usdkrw, krxkrw_g = latest_row
+
+            # 계산 로직
             # 국제 금 가격 (원/그램) = (온스당 달러 * 달러/원) / 온스당 그램 수
-            # 🚨 개선: self 대신 GoldKimpAnalyzer 클래스 이름으로 상수 접근
-            df['xau_krw_g'] = (df['xauusd_oz'] * df['usdkrw']) / GoldKimpAnalyzer.OUNCE_TO_GRAM
-            
+            xau_krw_g = (xauusd_oz * usdkrw) / GoldKimpAnalyzer.OUNCE_TO_GRAM
+
             # 프리미엄 (김프) 계산
-            df['premium_rate'] = ((df['krxkrw_g'] - df['xau_krw_g']) / df['xau_krw_g']) * 100
+            premium_rate = ((krxkrw_g - xau_krw_g) / xau_krw_g) * 100
 
-            latest = df.iloc[-1]
-            
-            # 4. 반환
-            # 🚨 개선: 불필요한 float() 캐스팅 제거
+            # 🚨 개선: round() 제거 — 표시 시점의 포맷 문자열이 양자화함
             return (
-                latest['krxkrw_g'],          # KRX 금 가격 (원/그램)
-                latest['xau_krw_g'],        # 국제 금 가격 (원/그램)
-                round(latest['premium_rate'], 4)  # 프리미엄 (김프, 소수점 4자리)
+                krxkrw_g,                 # KRX 금 가격 (원/그램)
+                xau_krw_g,                # 국제 금 가격 (원/그램)
+                premium_rate              # 프리미엄 (김프)
             )
         except Exception as e:
-            logging.error(f"_calculate_metrics에서 처리 중 오류 발생: {e}")
+            logging.error("_calculate_metrics에서 처리 중 오류 발생: %s", e)
             return None
 
     # 🔹 메인 루프용 안전한 호출 메서드
-    def get_core_metrics(self):
+    async def get_core_metrics(self):
         """주요 지표를 가져와서 반환합니다. 오류 시 (0.0, 0.0, 0.0)을 반환합니다."""
-        data = self._fetch_data()
+        data = await self._fetch_data()
         metrics = self._calculate_metrics(data) if data else None
         
         if metrics is None:
@@ -167,9 +288,14 @@ class GoldKimpAnalyzer:
         
         logging.info("지표 계산 및 반환 성공.")
         return metrics
-# gold_analyzer = GoldKimpAnalyzer()
+gold_analyzer = GoldKimpAnalyzer()
+
 
 
+# 🚨 개선: .get(..., {}) 체인이 호출마다 만드는 빈 dict 리터럴 대신
+# 모듈 수준 sentinel 하나를 재사용 (읽기 전용으로만 쓰일 것)
+_EMPTY: Dict[str, Any] = {}
+
 
 class FearGreedFetcher:
     """
@@ -189,86 +315,107 @@ class FearGreedFetcher:
     def __init__(self):
         pass
 
-    def fetch_all(self) -> tuple[float, float, float, float, str, float]:
-        """CNN + Upbit 데이터 모두 조회, 개별 오류 시 0 또는 빈 문자열 반환"""
-        
-        # 🚨 _fetch_cnn_data가 직접 결과를 튜플로 반환하도록 수정
-        공탐레이팅, 공탐, 풋엔콜레이팅, 풋엔콜값 = self._fetch_cnn_data()
-        
-        # 🚨 _fetch_upbit_data가 직접 결과를 튜플로 반환하도록 수정
-        코인레이팅, 코인 = self._fetch_upbit_data()
-        
+    async def fetch_all(self) -> tuple[float, float, float, float, str, float]:
+        """CNN + Upbit 데이터 모두 동시 조회, 개별 오류 시 0 또는 빈 문자열 반환"""
+
+        # 🚨 CNN과 Upbit 요청은 서로 독립적이므로 asyncio.gather로 동시 실행
+        (공탐레이팅, 공탐, 풋엔콜레이팅, 풋엔콜값), (코인레이팅, 코인) = await asyncio.gather(
+            self._fetch_cnn_data(),
+            self._fetch_upbit_data(),
+        )
+
         return (공탐레이팅, 공탐, 풋엔콜레이팅, 풋엔콜값, 코인레이팅, 코인)
 
 
-    def _fetch_cnn_data(self) -> tuple[float, float, float, float]:
-        """CNN Fear & Greed 지수 및 P/C 비율을 가져옵니다."""
+    async def _cnn_one(self, session: aiohttp.ClientSession, date_str: str):
+        """단일 날짜의 CNN graphdata를 가져옵니다. 실패 시 예외 발생."""
+        async with session.get(self.CNN_BASE_URL + date_str, headers=self.HEADERS,
+                               timeout=aiohttp.ClientTimeout(total=10)) as r:
+            r.raise_for_status()
+            return orjson.loads(await r.read())
+
+    async def _fetch_cnn_data(self) -> tuple[float, float, float, float]:
+        """CNN Fear & Greed 지수 및 P/C 비율을 가져옵니다.
+
+        🚨 오늘/어제 날짜를 순차 시도하는 대신 동시에 요청: 오늘 URL이
+        타임아웃(10s)으로 실패해도 최악 지연이 2×타임아웃 → 1×타임아웃."""
         today = datetime.now().date()
-        dates_to_try = [today.strftime("%Y-%m-%d"), (today - timedelta(days=1)).strftime("%Y-%m-%d")]
+        dates_to_try = [today.strftime("%Y-%m-%d"), (today - _ONE_DAY).strftime("%Y-%m-%d")]
+
+        session = await _get_http_session()
+        results = await asyncio.gather(
+            *(self._cnn_one(session, d) for d in dates_to_try),
+            return_exceptions=True,
+        )
 
+        # 오늘 데이터 우선, 실패 시 어제 데이터로 폴백
         data = None
-        for date_str in dates_to_try:
-            try:
-                r = requests.get(self.CNN_BASE_URL + date_str, headers=self.HEADERS, timeout=10)
-                r.raise_for_status()
-                data = r.json()
-                logging.info(f"CNN 데이터 {date_str}에서 성공적으로 가져옴.")
-                break
-            except requests.exceptions.RequestException as e:
-                 logging.warning(f"CNN 요청 실패 ({date_str}): {e}")
-                 continue
-            except Exception as e:
-                 logging.error(f"CNN 데이터 처리 오류: {e}")
-                 continue
+        for date_str, result in zip(dates_to_try, results):
+            if isinstance(result, BaseException):
+                logging.warning("CNN 요청 실패 (%s): %s", date_str, result)
+                continue
+            data = result
+            logging.info("CNN 데이터 %s에서 성공적으로 가져옴.", date_str)
+            break
 
         # CNN 데이터가 아예 없으면 모두 0.0 반환
         if not data:
             return self.ERROR_VALUE, self.ERROR_VALUE, self.ERROR_VALUE, self.ERROR_VALUE
 
         # Fear & Greed
-        fg_data = data.get("fear_and_greed", {})
-        # 🚨 개선: or 0 제거 (get()의 기본값 0.0으로 충분)
-        공탐레이팅 = fg_data.get("rating", self.ERROR_VALUE) 
-        공탐 = fg_data.get("score", self.ERROR_VALUE) 
+        # 🚨 개선: .get(..., {}) 체인 대신 직접 접근 + try/except
+        # (miss마다 빈 dict를 새로 할당하던 비용 제거)
+        try:
+            fg_data = data["fear_and_greed"]
+            공탐레이팅 = fg_data["rating"]
+            공탐 = fg_data["score"]
+        except (KeyError, TypeError):
+            공탐레이팅 = 공탐 = self.ERROR_VALUE
 
         # Put/Call
-        put_call_data = data.get("put_call_options", {})
-        # 🚨 개선: or 0 제거
-        풋엔콜레이팅 = put_call_data.get("rating", self.ERROR_VALUE) 
-        pc_list = put_call_data.get("data", [])
-        # 🚨 개선: 리스트가 비어있는지 확인하고, or 0 제거
-        풋엔콜값 = pc_list[-1].get("y", self.ERROR_VALUE) if pc_list else self.ERROR_VALUE
-        
+        try:
+            put_call_data = data["put_call_options"]
+            풋엔콜레이팅 = put_call_data["rating"]
+            풋엔콜값 = put_call_data["data"][-1]["y"]
+        except (KeyError, TypeError, IndexError):
+            풋엔콜레이팅 = 풋엔콜값 = self.ERROR_VALUE
+
         return 공탐레이팅, 공탐, 풋엔콜레이팅, 풋엔콜값
 
 
-    def _fetch_upbit_data(self) -> tuple[str, float]:
+    async def _fetch_upbit_data(self) -> tuple[str, float]:
         """업비트 코인 공포/탐욕 지수를 가져옵니다."""
         try:
-            r = requests.get(self.UPBIT_FG_API, headers=self.HEADERS, timeout=10)
-            r.raise_for_status()
-            data = r.json()
+            session = await _get_http_session()
+            async with session.get(self.UPBIT_FG_API, headers=self.HEADERS,
+                                   timeout=aiohttp.ClientTimeout(total=10)) as r:
+                r.raise_for_status()
+                data = orjson.loads(await r.read())
             logging.info("Upbit 데이터 성공적으로 가져옴.")
-        except requests.exceptions.RequestException as e:
-            logging.error(f"Upbit 요청 오류 발생: {e}")
+        except aiohttp.ClientError as e:
+            logging.error("Upbit 요청 오류 발생: %s", e)
             return self.ERROR_RATING_STR, self.ERROR_VALUE
         except Exception as e:
-            logging.error(f"Upbit 데이터 처리 오류: {e}")
+            logging.error("Upbit 데이터 처리 오류: %s", e)
             return self.ERROR_RATING_STR, self.ERROR_VALUE
 
-        coin_fg = None
-        for indicator in data.get("data", {}).get("indicators", []):
-            if indicator.get("info", {}).get("category") == "fear":
-                coin_fg = indicator
-                break
+        # 🚨 개선: 선형 스캔을 next() + 제너레이터로 (할당 없는 단일 패스)
+        try:
+            indicators = data["data"]["indicators"]
+        except (KeyError, TypeError):
+            indicators = []
+        coin_fg = next(
+            (i for i in indicators if i.get("info", _EMPTY).get("category") == "fear"),
+            None,
+        )
 
         if not coin_fg:
             logging.warning("Upbit 응답에서 코인 공포/탐욕 지수를 찾을 수 없습니다.")
             return self.ERROR_RATING_STR, self.ERROR_VALUE
 
         # 코인 레이팅은 문자열 (예: "공포", "탐욕")이므로 float 대신 str로 반환하도록 수정
-        코인레이팅 = coin_fg.get("chart", {}).get("gauge", {}).get("name", self.ERROR_RATING_STR)
-        코인 = coin_fg.get("price", {}).get("tradePrice", self.ERROR_VALUE)
+        코인레이팅 = coin_fg.get("chart", _EMPTY).get("gauge", _EMPTY).get("name", self.ERROR_RATING_STR)
+        코인 = coin_fg.get("price", _EMPTY).get("tradePrice", self.ERROR_VALUE)
         
         # 🚨 주의: 현재 fetch_all의 타입 힌트 (float, float)에 맞추기 위해 코인레이팅을 float 대신 str로 반환하도록 
         #           fetch_all의 타입 힌트를 수정했습니다. (튜플: float, float, float, float, str, float)
@@ -277,17 +424,92 @@ class FearGreedFetcher:
 fetcher = FearGreedFetcher()
 
 
+# 개별 fetcher 실패 시 사용할 기본값 (모두 "데이터 없음" 상태)
+_FG_DEFAULT = (0.0, 0.0, 0.0, 0.0, "", 0.0)
+_FX_DEFAULT = (0.0, 0.0, 0.0)
+_GOLD_DEFAULT = (0.0, 0.0, 0.0)
+
+# ⭐️ TTL 캐시: 각 데이터의 자연스러운 갱신 주기에 맞춰 재조회
+# (금 김프/공포·탐욕은 1시간, 환율·USDT는 5분)
+_market_cache: Dict[str, Tuple[float, Any]] = {}
+
+
+async def _cached_fetch(key: str, ttl: float, fetch):
+    """TTL 내에는 캐시된 값을 반환하고, 만료 시에만 fetch()를 다시 호출합니다."""
+    entry = _market_cache.get(key)
+    if entry is not None and time.monotonic() - entry[0] <= ttl:
+        return entry[1]
+    value = await fetch()
+    _market_cache[key] = (time.monotonic(), value)
+    return value
+
+
+async def get_gold_metrics_cached() -> tuple[float, float, float]:
+    return await _cached_fetch("gold", 3600, gold_analyzer.get_core_metrics)
+
+
+async def get_fear_greed_cached() -> tuple[float, float, float, float, str, float]:
+    return await _cached_fetch("fear_greed", 3600, fetcher.fetch_all)
+
+
+async def get_fx_cached() -> tuple[float, float, float]:
+    return await _cached_fetch("fx", 300, get_usdt_and_exchange_rate)
+
+
+async def get_all_market_data() -> tuple[tuple, tuple, tuple]:
+    """
+    보조 시장 데이터(공포/탐욕, USDT/환율, 금 김프)를 모두 동시에 조회합니다.
+    전체 소요 시간은 '합'이 아니라 가장 느린 요청 하나의 시간으로 줄어듭니다.
+    TTL 내 반복 호출은 네트워크 없이 캐시에서 응답하며,
+    개별 실패는 해당 그룹의 기본값으로 대체됩니다.
+    """
+    fg, fx, gold = await asyncio.gather(
+        get_fear_greed_cached(),
+        get_fx_cached(),
+        get_gold_metrics_cached(),
+        return_exceptions=True,
+    )
+    if isinstance(fg, BaseException):
+        logging.error("공포/탐욕 조회 실패: %s", fg)
+        fg = _FG_DEFAULT
+    if isinstance(fx, BaseException):
+        logging.error("USDT/환율 조회 실패: %s", fx)
+        fx = _FX_DEFAULT
+    if isinstance(gold, BaseException):
+        logging.error("금 김프 조회 실패: %s", gold)
+        gold = _GOLD_DEFAULT
+    return fg, fx, gold
+
 
 
-# Set Matplotlib backend (required for headless server environment)
-matplotlib.use('Agg')
 
 # =========================================================
 # --- [1] Configuration, Environment Variables, and Global State ---
 # =========================================================
 # Set Korean Standard Time (KST) timezone
 KST_TZ = ZoneInfo("Asia/Seoul")
-MONITOR_INTERVAL_SECONDS = 60 # Check time every 1 minute
+
+# ⭐️ [수정] 자주 쓰는 timedelta는 모듈 상수로 (호출마다 생성/정규화 방지)
+_ONE_DAY = timedelta(days=1)
+
+# ⭐️ 전송을 건너뛰는 요일 (월=0, 일=6) — O(1) 멤버십 검사용 frozenset
+SKIP_DAYS: frozenset = frozenset({0, 6})
+
+# ⭐️ [신규] KST "현재 시각" 문자열 1초 캐시 (aiohttp TimeService와 같은 패턴):
+# 대시보드/자체 핑 모두 1초 해상도면 충분하므로, 같은 초 안의 호출은
+# tz-aware now() + strftime을 건너뜁니다.
+_cached_now_ts = 0
+_cached_now_str = ""
+
+
+def kst_now_str() -> str:
+    """현재 KST 시각을 'YYYY-MM-DD HH:MM:SS KST'로 반환합니다 (1초 캐시)."""
+    global _cached_now_ts, _cached_now_str
+    t = int(time.time())
+    if t != _cached_now_ts:
+        _cached_now_ts = t
+        _cached_now_str = datetime.now(KST_TZ).strftime("%Y-%m-%d %H:%M:%S KST")
+    return _cached_now_str
 
 # ⏰ Global State: User-configurable send time (KST)
 # ⭐️ [수정] DST가 적용되지 않은 '기준 시간'으로 변수명 변경 (예: 겨울철 시간 06:20)
@@ -308,6 +530,13 @@ TELEGRAM_BOT_TOKEN = os.environ.get('TELEGRAM_BOT_TOKEN', 'YOUR_BOT_TOKEN_HERE')
 TELEGRAM_TARGET_CHAT_ID = os.environ.get('TELEGRAM_TARGET_CHAT_ID', '-1000000000')
 SERVER_PORT = int(os.environ.get("PORT", 8000))
 
+# ⭐️ [수정] 루프백 self-ping은 Render의 외부 유휴 감지에 잡히지 않으므로
+# 기본 비활성화. 실제 sleep 방지는 외부 keepalive(UptimeRobot, cron 등)가
+# 공개 URL을 주기적으로 호출하게 하세요. 필요 시 ENABLE_SELF_PING=1로 복구.
+ENABLE_SELF_PING = os.environ.get('ENABLE_SELF_PING', '0') == '1'
+# ⭐️ [수정] 자체 핑 주기는 배포 환경별로 조정 가능하도록 환경 변수화 (초 단위)
+SELF_PING_INTERVAL = int(os.environ.get('SELF_PING_INTERVAL', 300))
+
 
 # Logging setup (INFO level for main operations)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -318,222 +547,422 @@ if 'YOUR_BOT_TOKEN_HERE' in TELEGRAM_BOT_TOKEN or TELEGRAM_TARGET_CHAT_ID == '-1
     logger.warning("⚠️ Warning: TELEGRAM_BOT_TOKEN or CHAT_ID is set to default. Please configure environment variables.")
 
 # 💾 Server RAM state (may reset upon Render restart - no disk usage)
-status = {
-    "last_sent_date_kst": "1970-01-01", 
-    "last_check_time_kst": "N/A",
-    "next_scheduled_time_kst": "N/A",
-    "last_self_ping_kst": "N/A"
-}
+# ⭐️ [수정] dict 대신 slots 데이터클래스: 속성 접근이 해시 조회보다 빠르고 타입 체크 가능
+@dataclass(slots=True)
+class Status:
+    # ⭐️ [수정] 전송일은 문자열 대신 date 객체로 보관: 루프의 동등 비교가
+    # strftime 없이 slot 비교로 끝납니다. (표시할 때만 str()로 포맷)
+    last_sent_date_kst: date = date.min
+    last_check_time_kst: str = "N/A"
+    next_scheduled_time_kst: str = "N/A"
+    last_self_ping_kst: str = "N/A"
+
+status = Status()
 
 # =========================================================
 # --- [2] VIX Plotter Function (Chart Generation Logic) ---
 # =========================================================
-def _sync_fetch_and_plot_data(width=6.4, height=4.8) -> Optional[Tuple[io.BytesIO, float, float, str]]:
+# ⭐️ [수정] yfinance 대신 Yahoo 차트 API를 aiohttp로 직접 호출
+# (두 티커를 동시에 다운로드 + pandas 파싱 오버헤드 제거)
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/{symbol}?range=1y&interval=1d"
+
+
+async def fetch_yahoo_chart(session: aiohttp.ClientSession, symbol: str) -> Tuple["np.ndarray", "np.ndarray"]:
     """
-    INTERNAL: Synchronously fetches data using yfinance and generates the chart
-    using Matplotlib. 이 함수는 별도의 스레드에서 실행되도록 설계되었습니다.
-    
-    데이터 다운로드 실패 시 예외(ValueError 등)를 발생시킵니다.
+    Yahoo 차트 API에서 심볼 하나의 1년치 일봉 종가를 가져와
+    (timestamps[int64 초], closes[float64]) NumPy 배열로 반환합니다.
+    결측(null) 종가는 제거됩니다. 실패 시 예외를 발생시킵니다.
     """
-    tickers = ["^VIX", "^GSPC"]
-    vix, qqq = None, None
-    
-    # ⭐️ [수정] 차트 기간을 최근 1년으로 동적 설정
-    today = datetime.now()
-    one_year_ago = today - timedelta(days=365)
-    start_date = one_year_ago.strftime("%Y-%m-%d")
-    
-    
-    logger.info(f"Executing synchronous data download and chart generation... (Start Date: {start_date})")
-    # Download data using yfinance
-    data_all = yf.download(tickers, start=start_date, progress=False, timeout=20)
-            
-    # Extract Close data
-    vix_df = data_all['Close']['^VIX'].dropna()
-    gspc_df = data_all['Close']['^GSPC'].dropna()
-            
-    # Align common dates
-    common_dates = vix_df.index.intersection(gspc_df.index)
-    vix = vix_df.loc[common_dates]
-    qqq = gspc_df.loc[common_dates]
+    _load_numpy()  # 파싱에 numpy만 필요 (matplotlib은 렌더 워커 몫)
+
+    async with session.get(YAHOO_CHART_URL.format(symbol=symbol),
+                           headers=FearGreedFetcher.HEADERS,
+                           timeout=aiohttp.ClientTimeout(total=20)) as r:
+        r.raise_for_status()
+        data = orjson.loads(await r.read())
+
+    result = data["chart"]["result"][0]
+    timestamps = np.asarray(result["timestamp"], dtype=np.int64)
+    closes = np.asarray(
+        result["indicators"]["quote"][0]["close"], dtype=np.float64
+    )
+    valid = ~np.isnan(closes)
+    return timestamps[valid], closes[valid]
+
+
+async def fetch_vix_gspc() -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", float, float, str]:
+    """
+    VIX/S&P 500 데이터를 TTL 캐시(1시간)를 거쳐 반환합니다.
+    일봉 데이터는 하루에 한 번만 바뀌므로 같은 시간 창 안의 재시도/재호출은
+    네트워크 왕복 없이 캐시에서 응답합니다. (메모리 캐시만 사용 — 디스크 미사용)
+    """
+    return await _cached_fetch("vix_gspc", 3600, _fetch_vix_gspc_uncached)
+
+
+async def _fetch_vix_gspc_uncached() -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", float, float, str]:
+    """
+    VIX와 S&P 500 종가를 동시에 다운로드하고 공통 거래일 기준으로 정렬합니다.
+    반환: (공통 timestamps, vix 종가, gspc 종가, 최신 VIX, 최신 GSPC, 최신 날짜 UTC)
+    """
+    _load_numpy()  # 정렬 경로는 numpy만 필요
+
+    session = await _get_http_session()
+    logger.info("Executing concurrent Yahoo chart downloads (^VIX, ^GSPC)...")
+    (vix_t, vix_c), (gspc_t, gspc_c) = await asyncio.gather(
+        fetch_yahoo_chart(session, "^VIX"),
+        fetch_yahoo_chart(session, "^GSPC"),
+    )
+
+    # Align common dates at C speed (both timestamp arrays are sorted/unique)
+    common, vix_idx, gspc_idx = np.intersect1d(
+        vix_t, gspc_t, assume_unique=True, return_indices=True
+    )
+    vix_vals = vix_c[vix_idx]
+    gspc_vals = gspc_c[gspc_idx]
 
     # Data validation
-    if vix.empty or qqq.empty:
+    if common.size == 0:
         raise ValueError("Downloaded data is empty after aligning dates.")
 
     # ⭐️ Extract latest data for caption ⭐️
-    latest_vix = vix.iloc[-1].item()
-    latest_gspc = qqq.iloc[-1].item()
-    # Use the latest date from either index
-    latest_date_utc = max(vix.index[-1], qqq.index[-1]).strftime('%Y-%m-%d')
-    
-    logger.info(f"Data downloaded successfully (VIX={latest_vix:.2f}, S&P500={latest_gspc:.0f}).")
+    latest_vix = float(vix_vals[-1])
+    latest_gspc = float(gspc_vals[-1])
+    latest_date_utc = datetime.fromtimestamp(
+        int(max(vix_t[-1], gspc_t[-1])), tz=timezone.utc
+    ).strftime('%Y-%m-%d')
 
+    logger.info("Data downloaded successfully (VIX=%.2f, S&P500=%.0f).", latest_vix, latest_gspc)
+    return common, vix_vals, gspc_vals, latest_vix, latest_gspc, latest_date_utc
 
-    # --- Chart Generation (CPU-bound) ---
+
+# ⭐️ 차트 렌더링 전용 프로세스 풀: GIL 밖에서 CPU 작업 수행 → 렌더링 중에도
+# 이벤트 루프(핑/대시보드 응답)가 멈추지 않음. 워커는 matplotlib import를
+# 프로세스 수명 동안 유지하므로 두 번째 렌더부터는 warm 상태입니다.
+PLOT_POOL: Optional[concurrent.futures.ProcessPoolExecutor] = None
+
+# 차트는 거래일당 1번만 바뀌므로 최신 날짜 기준으로 PNG 바이트를 메모이즈
+_chart_cache: Dict[str, bytes] = {}
+
+
+def _get_plot_pool() -> concurrent.futures.ProcessPoolExecutor:
+    global PLOT_POOL
+    if PLOT_POOL is None:
+        # ⭐️ initializer로 렌더 워커가 뜨자마자 matplotlib 스타일/폰트 캐시를 예열
+        PLOT_POOL = concurrent.futures.ProcessPoolExecutor(
+            max_workers=1, initializer=_init_plot_worker)
+    return PLOT_POOL
+
+
+async def _warm_plot_worker():
+    """startup 시 렌더 워커 프로세스를 미리 띄워 initializer 예열을 끝내 둡니다.
+    첫 일일 전송이 프로세스 spawn + matplotlib import 비용을 내지 않습니다."""
     try:
-        plt.style.use('dark_background')
-        
-        fig, ax1 = plt.subplots(figsize=(width, height)) 
-        ax2 = ax1.twinx()
-        
-        # Set background color
-        fig.patch.set_facecolor('#222222')
-        ax1.set_facecolor('#2E2E2E')
-        ax2.set_facecolor('#2E2E2E')
-        
-        # Data and colors
-        title_text = f"S&P 500 ({latest_gspc:.2f}) vs VIX ({latest_vix:.2f})"
-        vix_color = '#FF6B6B' # VIX color (Red tone)
-        qqq_color = '#6BCBFF' # S&P 500 color (Blue tone)
-        new_fontsize = 8 * 1.3
-        
-        # Plotting
-        ax2.plot(common_dates, vix.values, color=vix_color, linewidth=1.5)
-        # S&P 500 (GSPC)
-        ax1.plot(common_dates, qqq.values, color=qqq_color, linewidth=1.5)
-        
-        # ⭐️ [수정] X축 포맷과 간격을 1달 단위로 설정
-        formatter = mdates.DateFormatter('%Y-%m') # 연-월 형식
-        ax1.xaxis.set_major_formatter(formatter)
-        ax1.xaxis.set_major_locator(mdates.MonthLocator(interval=1)) # 1달 간격
-        fig.autofmt_xdate(rotation=45)
-
-        # Y-axis label setting
-        ax1.set_ylabel('S&P 500 Index', color=qqq_color, fontsize=12, fontweight='bold', labelpad=5)
-        ax2.set_ylabel('VIX (Volatility)', color=vix_color, fontsize=12, fontweight='bold', labelpad=5)
-        
-        # Add VIX level annotations and horizontal lines
+        loop = asyncio.get_running_loop()
+        # no-op 제출 → 워커 spawn + initializer 실행 유도
+        await loop.run_in_executor(_get_plot_pool(), int)
+    except Exception as e:
+        logger.warning("⚠️ Plot worker warmup failed (will retry on first render): %s", e)
+
+
+# ⭐️ [수정] Figure를 렌더마다 새로 만들지 않고 재사용: figure 생성은 폰트 캐시,
+# axes, Agg 캔버스 버퍼 할당을 동반 → 호출당 수십 ms + 수 MB 할당/해제 churn.
+# 렌더 워커 프로세스 안에서 한 번 만들고 clear 후 다시 그립니다.
+_render_lock = threading.Lock()
+_FIG = None
+_AX1 = None
+_AX2 = None
+# ⭐️ X축 포맷터/로케이터도 렌더마다 새로 만들지 않고 재사용
+# (lazy-import 구조라 모듈 import 시점에는 만들 수 없어 figure와 함께 생성)
+_DATE_FMT = None
+_MONTH_LOC = None
+
+
+def _get_persistent_axes(width: float, height: float):
+    """재사용 가능한 (fig, ax1, ax2)를 반환합니다. 최초 호출 시에만 생성."""
+    global _FIG, _AX1, _AX2, _DATE_FMT, _MONTH_LOC
+    if _FIG is None:
+        _FIG, _AX1 = plt.subplots(figsize=(width, height))
+        _AX2 = _AX1.twinx()
+        _DATE_FMT = mdates.DateFormatter('%Y-%m')  # 연-월 형식
+        _MONTH_LOC = mdates.MonthLocator(interval=1)  # 1달 간격
+    else:
+        _FIG.set_size_inches(width, height)
+        # 이전 렌더의 아티스트를 비움 (axes 객체 자체는 유지)
+        _AX1.clear()
+        _AX2.clear()
+    return _FIG, _AX1, _AX2
+
+
+def _sync_render_chart(common_ts, vix_vals, gspc_vals, latest_vix, latest_gspc,
+                       width=6.4, height=4.8) -> Optional[bytes]:
+    """
+    INTERNAL: Synchronously renders the chart using Matplotlib from pre-fetched
+    NumPy arrays. 이 함수는 별도의 스레드에서 실행되도록 설계되었습니다.
+    """
+    # Load (and cache) the heavy charting libraries + style on first use
+    # (풀 initializer가 이미 돌렸다면 플래그 체크만 하고 바로 반환)
+    _init_plot_worker()
+
+    # ⭐️ [수정] 히스토리가 길어져도 렌더 비용이 무한히 커지지 않도록
+    # 400 포인트 초과 시 균일 stride로 다운샘플 (항상 마지막 봉은 유지 —
+    # 제목의 최신값과 차트 끝점이 일치해야 함). 멀티-이어 VIX 비교에서
+    # 시각적 차이는 없습니다.
+    n = len(common_ts)
+    if n > 400:
+        step = -(-n // 400)  # ceil(n / 400)
+        idx = np.arange(n - 1, -1, -step)[::-1]  # 끝에서부터 역방향 stride
+        common_ts = common_ts[idx]
+        vix_vals = vix_vals[idx]
+        gspc_vals = gspc_vals[idx]
+
+    # Convert epoch seconds to matplotlib-friendly datetime64 dates
+    common_dates = common_ts.astype('datetime64[s]')
+
+    # --- Chart Generation (CPU-bound) ---
+    # ⭐️ 재사용 figure는 한 번에 하나의 렌더만 접근하도록 lock으로 보호
+    with _render_lock:
         try:
-            # Find the date position for annotation
-            new_text_x_pos = common_dates[int(len(common_dates)*0.9)]
-        except:
-             # Safety net for very little data
-            new_text_x_pos = common_dates[-1] + timedelta(days=1)
+            # (dark_background 스타일은 _init_plot_worker에서 프로세스당 1회 적용)
+            fig, ax1, ax2 = _get_persistent_axes(width, height)
+
+            # Set background color
+            fig.patch.set_facecolor('#222222')
+            ax1.set_facecolor('#2E2E2E')
+            ax2.set_facecolor('#2E2E2E')
         
-        # VIX annotations
-        # ax2.text(new_text_x_pos, 15.5, "VIX 15 (Greed/Sell)", color='yellow', fontsize=new_fontsize, verticalalignment='bottom', horizontalalignment='right', fontweight='bold')
-        # ax2.text(new_text_x_pos, 30.5, "VIX 30 (Warning)", color='peru', fontsize=new_fontsize, verticalalignment='bottom', horizontalalignment='right', fontweight='bold')
-        # ax2.text(new_text_x_pos, 40.5, "VIX 40 (Fear/Buy)", color='yellow', fontsize=new_fontsize, verticalalignment='bottom', horizontalalignment='right', fontweight='bold')
+            # Data and colors
+            title_text = f"S&P 500 ({latest_gspc:.2f}) vs VIX ({latest_vix:.2f})"
+            vix_color = '#FF6B6B' # VIX color (Red tone)
+            qqq_color = '#6BCBFF' # S&P 500 color (Blue tone)
+            new_fontsize = 8 * 1.3
         
-        # VIX horizontal lines
-        ax2.axhline(y=15, color='lightgreen', linestyle='--', linewidth=1.2, alpha=0.8)
-        ax2.axhline(y=30, color='peru', linestyle='--', linewidth=1.0, alpha=0.8)
-        ax2.axhline(y=40, color='yellow', linestyle='--', linewidth=1.2, alpha=0.8)
+            # Plotting (rasterized: anti-aliased lines encode as one raster block)
+            ax2.plot(common_dates, vix_vals, color=vix_color, linewidth=1.5, rasterized=True)
+            # S&P 500 (GSPC)
+            ax1.plot(common_dates, gspc_vals, color=qqq_color, linewidth=1.5, rasterized=True)
         
-        # Title and minimal margin
-        fig.suptitle(title_text, color='white', fontsize=12, fontweight='bold', y=0.98) 
-        fig.tight_layout(rect=[0.025, 0.025, 1, 1]) 
+            # ⭐️ [수정] X축 포맷과 간격을 1달 단위로 설정 (재사용 객체 재부착 —
+            # ax.clear()가 기본 로케이터로 되돌리므로 부착만 매 렌더 수행)
+            ax1.xaxis.set_major_formatter(_DATE_FMT)
+            ax1.xaxis.set_major_locator(_MONTH_LOC)
+            fig.autofmt_xdate(rotation=45)
+
+            # Y-axis label setting
+            ax1.set_ylabel('S&P 500 Index', color=qqq_color, fontsize=12, fontweight='bold', labelpad=5)
+            ax2.set_ylabel('VIX (Volatility)', color=vix_color, fontsize=12, fontweight='bold', labelpad=5)
         
-        # ⭐️ Save to memory buffer as PNG image (Crucial: no disk usage) ⭐️
-        plot_data = io.BytesIO()
-        plt.savefig(plot_data, format='png', dpi=150, bbox_inches='tight', pad_inches=0.1) 
-        plot_data.seek(0)
+            # Add VIX level annotations and horizontal lines
+            try:
+                # Find the date position for annotation
+                new_text_x_pos = common_dates[int(len(common_dates)*0.9)]
+            except:
+                 # Safety net for very little data
+                new_text_x_pos = common_dates[-1] + _ONE_DAY
         
-        plt.close(fig) # **VERY IMPORTANT: Prevent memory leak**
-        logger.info("✅ Chart generation complete (saved to memory).")
+            # VIX annotations
+            # ax2.text(new_text_x_pos, 15.5, "VIX 15 (Greed/Sell)", color='yellow', fontsize=new_fontsize, verticalalignment='bottom', horizontalalignment='right', fontweight='bold')
+            # ax2.text(new_text_x_pos, 30.5, "VIX 30 (Warning)", color='peru', fontsize=new_fontsize, verticalalignment='bottom', horizontalalignment='right', fontweight='bold')
+            # ax2.text(new_text_x_pos, 40.5, "VIX 40 (Fear/Buy)", color='yellow', fontsize=new_fontsize, verticalalignment='bottom', horizontalalignment='right', fontweight='bold')
         
-        # ⭐️ Return chart buffer and latest data as a tuple ⭐️
-        return plot_data, latest_vix, latest_gspc, latest_date_utc
+            # VIX horizontal lines
+            ax2.axhline(y=15, color='lightgreen', linestyle='--', linewidth=1.2, alpha=0.8)
+            ax2.axhline(y=30, color='peru', linestyle='--', linewidth=1.0, alpha=0.8)
+            ax2.axhline(y=40, color='yellow', linestyle='--', linewidth=1.2, alpha=0.8)
+        
+            # Title and minimal margin
+            fig.suptitle(title_text, color='white', fontsize=12, fontweight='bold', y=0.98)
+            # ⭐️ [수정] tight_layout(레이아웃 엔진 재실행) 대신 고정 마진 1회 지정
+            fig.subplots_adjust(left=0.09, right=0.91, top=0.92, bottom=0.16)
+
+            # ⭐️ Save to memory buffer as PNG image (Crucial: no disk usage) ⭐️
+            # ⭐️ [수정] savefig 경로 대신 Agg 캔버스의 RGBA 버퍼를 직접 꺼내
+            # Pillow로 PNG 인코딩: savefig의 레이아웃/인코딩 오버헤드를 건너뛰고
+            # compress_level=1(zlib 최저 압축)로 인코딩 시간을 줄입니다.
+            fig.canvas.draw()
+            buf = fig.canvas.buffer_rgba()  # memoryview — 바이트 복사 없음
+            img = PILImage.frombuffer('RGBA', fig.canvas.get_width_height(),
+                                      buf, 'raw', 'RGBA', 0, 1)
+            # ⭐️ [수정] 어두운 배경 + 선 몇 개뿐인 차트에 32-bit RGBA는 과함:
+            # 8-bit 팔레트(PNG 'P' 모드)로 양자화해 업로드 바이트를 크게 줄입니다.
+            # (알파 채널은 불필요 — RGB로 평탄화 후 adaptive 팔레트 적용)
+            img = img.convert('RGB').convert(
+                'P', palette=PILImage.Palette.ADAPTIVE, colors=16)
+            plot_data = io.BytesIO()
+            img.save(plot_data, format='PNG', optimize=False, compress_level=1)
+            # ⭐️ 불변 bytes로 반환: aiohttp가 Content-Length를 설정할 수 있고
+            # (chunked framing 없이 단일 write), 재시도 시 스트림 위치 관리도 불필요
+            png_bytes = plot_data.getvalue()
+            plot_data.close()
+
+            # ⭐️ [수정] plt.close(fig) 제거: figure를 닫지 않고 다음 렌더에서 재사용
+            # (누수 방지는 _get_persistent_axes의 clear()가 담당)
+            logger.info("✅ Chart generation complete (saved to memory).")
+
+            # ⭐️ Return the encoded PNG bytes ⭐️
+            return png_bytes
 
-    except Exception as e:
-        logger.error(f"❌ Exception during chart generation: {e}", exc_info=True)
-        # If plotting fails, return None
-        return None
+        except Exception as e:
+            logger.error("❌ Exception during chart generation: %s", e, exc_info=True)
+            # If plotting fails, return None
+            return None
+
+
+async def _with_retries(fn, retries: int = 4, base: int = 2, cap: int = 30):
+    """
+    [ASYNC RETRY HELPER] Awaits fn() up to `retries` times with true exponential
+    backoff (base**attempt seconds, capped at `cap`). All waiting uses
+    asyncio.sleep so the event loop keeps serving pings during backoff.
+    Re-raises the last exception when every attempt fails.
+    """
+    last_exc: Optional[Exception] = None
+    for attempt in range(retries):
+        try:
+            return await fn()
+        except Exception as e:
+            last_exc = e
+            if attempt < retries - 1:
+                # Capped exponential backoff + jitter (avoids thundering herds
+                # when Yahoo/Telegram rate-limit)
+                sleep_time = min(cap, base ** attempt) + random.random()
+                logger.warning("Attempt %d/%d failed: %s. Retrying in %.1fs...", attempt + 1, retries, e, sleep_time)
+                await asyncio.sleep(sleep_time) # NON-BLOCKING SLEEP
+    raise last_exc
 
 
-async def plot_vix_sp500(width=6.4, height=4.8) -> Optional[Tuple[io.BytesIO, float, float, str]]:
+async def plot_vix_sp500(width=6.4, height=4.8) -> Optional[Tuple[bytes, float, float, str]]:
     """
     [ASYNC WRAPPER] Generates a comparative chart of VIX and S&P 500 closing prices,
     and returns the chart buffer along with the latest data.
-    
-    This function handles the retry logic asynchronously and enforces a strict timeout 
-    for the synchronous execution thread.
+
+    Retries are driven by _with_retries (capped exponential backoff), and a strict
+    timeout is enforced on the synchronous execution thread.
     """
     logger.info("📈 Starting async data download and chart generation...")
 
-    max_retry = 4 
     # Max time allowed for the plot function (well below the typical 60s gateway timeout)
-    PLOT_TIMEOUT_SECONDS = 50 
-    
-    for attempt in range(1, max_retry + 1):
-        try:
-            logger.info(f"Attempt {attempt}/{max_retry}: Executing data fetch and plot in background thread with a {PLOT_TIMEOUT_SECONDS}s timeout...")
-            
-            # ⭐️ Enforce a strict timeout on the background thread execution ⭐️
-            plot_result = await asyncio.wait_for(
-                asyncio.to_thread(_sync_fetch_and_plot_data, width, height),
-                timeout=PLOT_TIMEOUT_SECONDS
-            )
-            
-            if plot_result:
-                return plot_result
-            else:
-                # _sync_fetch_and_plot_data returned None (plotting failed)
-                raise Exception("Synchronous plot generation failed.")
-            
-        except asyncio.TimeoutError:
-            # Handle the specific case where the background thread took too long
-            logger.error(f"❌ Data download/plot exceeded the {PLOT_TIMEOUT_SECONDS}s timeout (Attempt {attempt}).")
-            if attempt == max_retry:
-                logger.error("Max retries exceeded due to timeout. Failed to acquire data.")
-                return None
-            # Continue to exponential backoff and retry
-            
-        except Exception as e:
-            # Handle I/O (e.g., yfinance download failure) or plotting exceptions from the background thread
-            logger.warning(f"Data download/plot failed (Attempt {attempt}): {e}")
-            if attempt < max_retry:
-                # Apply Exponential Backoff using non-blocking sleep
-                sleep_time = 5 ** attempt
-                logger.info(f"Applying Exponential Backoff. Waiting {sleep_time} seconds before next retry...")
-                await asyncio.sleep(sleep_time) # NON-BLOCKING SLEEP
-            else:
-                logger.error("Max retries exceeded. Failed to acquire data.")
-                return None
-    
-    return None
+    PLOT_TIMEOUT_SECONDS = 50
+
+    async def _attempt() -> Tuple[bytes, float, float, str]:
+        # ⭐️ Download stays on the event loop (pure I/O); only the CPU-bound
+        # rendering is offloaded, with a strict timeout on the whole attempt ⭐️
+        common, vix_vals, gspc_vals, latest_vix, latest_gspc, latest_date_utc = \
+            await asyncio.wait_for(fetch_vix_gspc(), timeout=PLOT_TIMEOUT_SECONDS)
+
+        # ⭐️ 같은 거래일의 차트는 이미 렌더된 PNG 바이트를 재사용 ⭐️
+        cached_png = _chart_cache.get(latest_date_utc)
+        if cached_png is not None:
+            logger.info("Chart cache hit for %s; skipping render.", latest_date_utc)
+            return cached_png, latest_vix, latest_gspc, latest_date_utc
+
+        # Render in the dedicated worker process (escapes the GIL entirely)
+        loop = asyncio.get_running_loop()
+        png_bytes = await asyncio.wait_for(
+            loop.run_in_executor(_get_plot_pool(), _sync_render_chart,
+                                 common, vix_vals, gspc_vals,
+                                 latest_vix, latest_gspc, width, height),
+            timeout=PLOT_TIMEOUT_SECONDS
+        )
+        if png_bytes is None:
+            # _sync_render_chart returned None (plotting failed)
+            raise Exception("Synchronous plot generation failed.")
+
+        _chart_cache.clear()  # keep only the current trading day
+        _chart_cache[latest_date_utc] = png_bytes
+        return png_bytes, latest_vix, latest_gspc, latest_date_utc
+
+    try:
+        return await _with_retries(_attempt)
+    except Exception as e:
+        logger.error("Max retries exceeded. Failed to acquire data: %s", e)
+        return None
 
 # =========================================================
 # --- [3] Telegram Sending Function (HTTP API) ---
 # =========================================================
-async def send_photo_via_http(chat_id: str, photo_bytes: io.BytesIO, caption: str) -> bool:
-    """Sends the chart image to the Telegram bot."""
+async def send_photo_via_http(chat_id: str, png_bytes: bytes, caption: str) -> bool:
+    """Sends the chart image (immutable PNG bytes) to the Telegram bot."""
     url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendPhoto"
-    
-    data = aiohttp.FormData()
-    data.add_field('chat_id', chat_id)
-    data.add_field('caption', caption)
-    data.add_field('parse_mode', 'Markdown')
-    # ⭐️ Pass the io.BytesIO object directly to the photo field ⭐️
-    data.add_field('photo', 
-                    photo_bytes, 
-                    filename='vix_gspc_chart.png', 
-                    content_type='image/png')
+
+    def _build_form() -> aiohttp.FormData:
+        # aiohttp FormData is single-use once its multipart writer is consumed,
+        # so rebuild it (cheap — the payload bytes are shared) per attempt.
+        data = aiohttp.FormData()
+        data.add_field('chat_id', chat_id)
+        data.add_field('caption', caption)
+        data.add_field('parse_mode', 'Markdown')
+        data.add_field('photo',
+                       png_bytes,
+                       filename='vix_gspc_chart.png',
+                       content_type='image/png')
+        return data
 
     # Add retry logic (for network issues)
+    # ⭐️ 공유 세션 재사용: 매 전송마다 TCP+TLS 핸드셰이크를 새로 치르지 않음 ⭐️
+    session = await _get_http_session()
     for attempt in range(3):
         try:
-            async with aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=60)) as session:
-                logger.info(f"Telegram send request initiated (Attempt {attempt + 1}/3, Chat ID: {chat_id})...")
-                async with session.post(url, data=data) as response:
-                    response.raise_for_status() # Raise exception for HTTP errors
-                    response_json = await response.json()
-                    if response_json.get('ok'):
-                        logger.info("✅ Telegram send successful!")
-                        return True
-                    else:
-                        error_desc = response_json.get('description', 'Unknown Error')
-                        raise Exception(f"Telegram API Error: {error_desc}")
-                        
+            data = _build_form()
+            logger.info("Telegram send request initiated (Attempt %d/3, Chat ID: %s)...", attempt + 1, chat_id)
+            async with session.post(url, data=data, timeout=aiohttp.ClientTimeout(total=60)) as response:
+                response.raise_for_status() # Raise exception for HTTP errors
+                # orjson (C-accelerated) parses the Telegram reply faster than stdlib json
+                response_json = orjson.loads(await response.read())
+                if response_json.get('ok'):
+                    logger.info("✅ Telegram send successful!")
+                    return True
+                else:
+                    error_desc = response_json.get('description', 'Unknown Error')
+                    raise Exception(f"Telegram API Error: {error_desc}")
+
+
         except Exception as e:
-            logger.warning(f"❌ Telegram send error (Attempt {attempt + 1}/3): {e}. Retrying shortly.")
+            logger.warning("❌ Telegram send error (Attempt %d/3): %s. Retrying shortly.", attempt + 1, e)
             if attempt < 2:
-                await asyncio.sleep(2 ** attempt) # Exponential Backoff: 1s, 2s wait
+                # Capped exponential backoff with jitter: ~1-3s wait
+                await asyncio.sleep(min(30, 2 ** attempt) + random.random())
             
     logger.error("Telegram send final failure.")
     return False
 
+
+async def _prewarm_telegram_connection():
+    """
+    하루 1회 전송 사이에 DNS/커넥션 풀이 식기 때문에, 전송 직전에 가벼운
+    getMe 호출로 api.telegram.org까지의 TLS 커넥션을 미리 데워 둡니다.
+    (큰 multipart POST가 시작될 때 warm socket이 풀에 준비됨)
+    """
+    try:
+        session = await _get_http_session()
+        async with session.get(f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/getMe",
+                               timeout=aiohttp.ClientTimeout(total=10)):
+            pass
+    except Exception as e:
+        logger.debug("Telegram pre-warm failed (harmless): %s", e)
+
+# ⭐️ [수정] 캡션 템플릿을 모듈 수준으로 호이스팅: 전송마다 f-string을 다시
+# 조립하지 않고, import 시점에 템플릿 오타가 바로 드러납니다.
+_CAPTION_TEMPLATE = (
+    "\n🗓️ {date} (US Market Closed)\n"
+    "📈 VIX (Volatility): {vix:.2f}\n"
+    "📉 S&P 500 (Index): {gspc:.2f}\n"
+    "🙏 S&P 500 (Fear/Greed): {fg_rating}"
+
+    # "공탐: {fg_value}\n"
+    # "💹 풋/콜: {pc_rating}\n"
+    # "풋/콜 값: {pc_value}\n"
+    # "🪙 업비트 (공포/탐욕): {coin_rating}\n\n"
+    # "코인: {coin_value}\n"
+
+    # "🇰🇷 KRX (At close 15:30): {gold_krx:,.0f} ₩/g\n"
+    # "🇺🇸 XAU/USD (Live): {gold_intl:,.0f} ₩/g\n"
+    # "⚖️ KRX Gold Premium: {gold_premium:.2f} %\n\n"
+
+    # "💵 USD/KRW: {usd_krw:,.0f}\n"
+    # "💸 USDT/KRW: {usdt_krw:,.0f}\n"
+    # "🏦 UPbit USDT Premium: {usdt_premium:.2f} %"
+)
+
+
 async def run_and_send_plot() -> bool:
     """Executes the full process of chart generation and sending."""
     global status
@@ -542,49 +971,47 @@ async def run_and_send_plot() -> bool:
         logger.error("Telegram token or Chat ID is set to default. Skipping send.")
         return False
         
-    # ⭐️ MUST AWAIT the call since plot_vix_sp500 is now an async function ⭐️
-    plot_result = await plot_vix_sp500()
-    
+    # ⭐️ 차트 생성과 보조 데이터 조회는 서로 독립적이므로 동시에 실행 ⭐️
+    # (차트가 완성될 때쯤 캡션용 보조 데이터도 이미 준비됨)
+    plot_task = asyncio.create_task(plot_vix_sp500())
+    market_task = asyncio.create_task(get_all_market_data())
+    # ⭐️ 차트가 완성되는 동안 Telegram TLS 커넥션을 미리 데워 둠 ⭐️
+    prewarm_task = asyncio.create_task(_prewarm_telegram_connection())
+    plot_result, (fg, fx, gold), _ = await asyncio.gather(plot_task, market_task, prewarm_task)
+
     if not plot_result:
         logger.error("Chart generation failed. Skipping send and recalculating next target time.")
         return False
-    
-    plot_buffer, latest_vix, latest_gspc, latest_date_utc = plot_result
-    
-    # Latest data is already fetched inside plot_vix_sp500
-    공탐레이팅, 공탐, 풋엔콜레이팅, 풋엔콜값, 코인레이팅, 코인 = fetcher.fetch_all()
-    # 테더원, 달러원, 달러테더괴리율 = get_usdt_and_exchange_rate()
-    # 한국시세, 국제시세, 괴리율 = gold_analyzer.get_core_metrics()
-
-    caption = (
-            f"\n🗓️ {latest_date_utc} (US Market Closed)\n"
-            f"📈 VIX (Volatility): {latest_vix:.2f}\n"   
-            f"📉 S&P 500 (Index): {latest_gspc:.2f}\n"
-            f"🙏 S&P 500 (Fear/Greed): {공탐레이팅}"                     
-            
-            # f"공탐: {공탐}\n"
-            # f"💹 풋/콜: {풋엔콜레이팅}\n"
-            # f"풋/콜 값: {풋엔콜값}\n"
-            # f"🪙 업비트 (공포/탐욕): {코인레이팅}\n\n"
-            # f"코인: {코인}\n"          
-            
-            # f"🇰🇷 KRX (At close 15:30): {한국시세:,.0f} ₩/g\n"
-            # f"🇺🇸 XAU/USD (Live): {국제시세:,.0f} ₩/g\n"
-            # f"⚖️ KRX Gold Premium: {괴리율:.2f} %\n\n"
-
-            # f"💵 USD/KRW: {달러원:,.0f}\n"
-            # f"💸 USDT/KRW: {테더원:,.0f}\n"            
-            # f"🏦 UPbit USDT Premium: {달러테더괴리율:.2f} %"
-            # f"🏦 달러 인덱스 대비 원화 평가: {달러대비원화}\n\n"
-        )
 
-    success = await send_photo_via_http(TELEGRAM_TARGET_CHAT_ID, plot_buffer, caption)
-    plot_buffer.close() # Close memory buffer (release memory)
+    png_bytes, latest_vix, latest_gspc, latest_date_utc = plot_result
+    공탐레이팅, 공탐, 풋엔콜레이팅, 풋엔콜값, 코인레이팅, 코인 = fg
+    테더원, 달러원, 달러테더괴리율 = fx
+    한국시세, 국제시세, 괴리율 = gold
+
+    caption = _CAPTION_TEMPLATE.format(
+        date=latest_date_utc,
+        vix=latest_vix,
+        gspc=latest_gspc,
+        fg_rating=공탐레이팅,
+        fg_value=공탐,
+        pc_rating=풋엔콜레이팅,
+        pc_value=풋엔콜값,
+        coin_rating=코인레이팅,
+        coin_value=코인,
+        gold_krx=한국시세,
+        gold_intl=국제시세,
+        gold_premium=괴리율,
+        usd_krw=달러원,
+        usdt_krw=테더원,
+        usdt_premium=달러테더괴리율,
+    )
+
+    success = await send_photo_via_http(TELEGRAM_TARGET_CHAT_ID, png_bytes, caption)
 
     if success:
         current_kst = datetime.now(KST_TZ)
-        status['last_sent_date_kst'] = current_kst.strftime("%Y-%m-%d")
-        logger.info(f"Successfully sent. Last sent date updated: {status['last_sent_date_kst']}")
+        status.last_sent_date_kst = current_kst.date()
+        logger.info("Successfully sent. Last sent date updated: %s", status.last_sent_date_kst)
     
     return success
 
@@ -593,23 +1020,38 @@ async def run_and_send_plot() -> bool:
 # =========================================================
 
 # ⭐️ [신규] DST를 매일 확인하기 위한 헬퍼 함수
+# ⭐️ [수정] astimezone(ZoneInfo)는 공짜가 아니므로 KST 달력 날짜 단위로 캐시.
+# DST 전환은 1년에 두 번뿐이라 같은 날짜 내 반복 호출은 모두 캐시 히트입니다.
+# (키에 기준 시각을 포함해 /set-time 변경 시 자동 무효화)
+_target_hour_cache: Dict[Tuple[Any, int], int] = {}
+
+
 def get_target_hour_for_kst_date(kst_date: datetime) -> int:
     """
     주어진 KST 날짜를 기준으로 뉴욕의 DST를 확인하여
     정확한 KST 전송 시간을 반환합니다. (예: 5시 또는 6시)
     """
     # 전역 상수(Base 시간 및 NY 시간대)를 사용
-    global BASE_TARGET_HOUR_KST, NY_TZ 
-    
+    global BASE_TARGET_HOUR_KST, NY_TZ
+
+    cache_key = (kst_date.date(), BASE_TARGET_HOUR_KST)
+    cached = _target_hour_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # KST 날짜(시간 포함)에 해당하는 뉴욕 시간을 확인
     ny_time_equivalent = kst_date.astimezone(NY_TZ)
-    
+
     target_hour = BASE_TARGET_HOUR_KST # 기본 시간 (겨울철 6시)
-    
+
     # .dst()가 0이 아닌 timedelta를 반환하면 (즉, DST 적용 중이면) True
     if ny_time_equivalent.dst():
         target_hour -= 1 # 여름철 5시
-    
+
+    # 최근 날짜 항목만 유지 (오늘/내일 조회가 반복되므로 소량만 보관)
+    if len(_target_hour_cache) > 8:
+        _target_hour_cache.clear()
+    _target_hour_cache[cache_key] = target_hour
     return target_hour
 
 # ⭐️ [수정] calculate_next_target_time 함수가 매일 DST를 새로 계산하도록 수정
@@ -633,7 +1075,7 @@ def calculate_next_target_time(now_kst: datetime) -> datetime:
     
     if now_kst >= target_time_today:
         # 이미 오늘 목표 시간이 지났다면, '내일'을 기준으로 다시 계산
-        tomorrow_kst = now_kst + timedelta(days=1)
+        tomorrow_kst = now_kst + _ONE_DAY
         
         # 2. '내일'의 정확한 목표 시간(DST 적용된)을 가져옵니다.
         tomorrow_target_hour = get_target_hour_for_kst_date(tomorrow_kst)
@@ -647,97 +1089,141 @@ def calculate_next_target_time(now_kst: datetime) -> datetime:
     else:
         # 아직 오늘 목표 시간이 안 지났으면, 오늘 목표 시간 사용
         next_target = target_time_today
-        
+
+    # ⭐️ [수정] SKIP_DAYS 요일 스킵을 발화 시점이 아니라 계산 시점에 처리:
+    # 스킵할 날에는 루프가 아예 깨어나지 않습니다. 하루씩 넘길 때마다
+    # 해당 날짜의 DST 적용 시각을 다시 조회합니다.
+    while next_target.weekday() in SKIP_DAYS:
+        next_target += _ONE_DAY
+        next_target = next_target.replace(
+            hour=get_target_hour_for_kst_date(next_target),
+            minute=BASE_TARGET_MINUTE_KST,
+            second=0,
+            microsecond=0
+        )
+
     return next_target
 
 
+# ⭐️ [신규] /set-time으로 기준 시각이 바뀌면 자고 있는 스케줄러를 즉시 깨움
+# (깨어난 루프는 전송 없이 다음 목표 시각만 다시 계산합니다)
+_schedule_changed = asyncio.Event()
+
+
 async def main_monitor_loop():
-    """Runs every minute, checks the send time, and triggers the job.
-    Includes a top-level try/except for maximum stability."""
+    """Sleeps until the exact target time, fires the job once, and reschedules.
+    Includes a top-level try/except for maximum stability.
+
+    ⭐️ [수정] 1분 폴링 대신 이벤트 기반 sleep: 하루 1439번의 불필요한
+    wakeup(시간 변환 + 로그 포맷)이 사라지고, 놓친 시각은 asyncio.sleep이
+    delta<=0일 때 즉시 반환하므로 별도의 catch-up 분기도 필요 없습니다."""
     global status
-    
+
     # Initial setup of next send time
     now_kst = datetime.now(KST_TZ)
     # ⭐️ 이제 이 함수는 호출 시점의 DST를 정확히 반영합니다.
     next_target_time_kst = calculate_next_target_time(now_kst)
-    status['next_scheduled_time_kst'] = next_target_time_kst.strftime("%Y-%m-%d %H:%M:%S KST")
-    
-    logger.info(f"🔍 Monitoring started. Next scheduled time (KST): {status['next_scheduled_time_kst']}")
-    
+    # ⭐️ [수정] 목표 시각이 바뀔 때 한 번만 포맷하고 저장 (매 wakeup마다 strftime 금지)
+    # epoch도 함께 캐시: sleep 시간 계산이 tz-aware datetime 빼기 대신
+    # float 빼기(time.time())로 끝납니다.
+    next_target_epoch = next_target_time_kst.timestamp()
+    next_target_str = next_target_time_kst.strftime("%Y-%m-%d %H:%M:%S KST")
+    target_date_kst = next_target_time_kst.date()
+    status.next_scheduled_time_kst = next_target_str
+
+    logger.info("🔍 Monitoring started. Next scheduled time (KST): %s", status.next_scheduled_time_kst)
+
     while True:
-        # Sleep first to wait for the next interval
-        await asyncio.sleep(MONITOR_INTERVAL_SECONDS)
-        
         # ⭐️ Top-level try/except block for maximum stability ⭐️
         try:
+            # Sleep directly until the target time (no per-minute wakeups)
+            # ⭐️ [수정] 단순 sleep 대신 schedule-change 이벤트를 기다림:
+            # /set-time이 이벤트를 set하면 타임아웃 전에 즉시 깨어납니다.
+            delta = next_target_epoch - time.time()
+            if delta > 0:
+                try:
+                    await asyncio.wait_for(_schedule_changed.wait(), timeout=delta)
+                except asyncio.TimeoutError:
+                    pass  # 정상 경로: 목표 시각 도달
+
+            if _schedule_changed.is_set():
+                # 기준 시각 변경으로 깨어남 → 전송 없이 목표만 재계산
+                _schedule_changed.clear()
+                next_target_time_kst = calculate_next_target_time(datetime.now(KST_TZ))
+                next_target_epoch = next_target_time_kst.timestamp()
+                next_target_str = next_target_time_kst.strftime("%Y-%m-%d %H:%M:%S KST")
+                target_date_kst = next_target_time_kst.date()
+                status.next_scheduled_time_kst = next_target_str
+                logger.info("🔄 Schedule changed. Next scheduled time (KST): %s", next_target_str)
+                continue
+
+            # ⭐️ [수정] 시계 읽기/포맷은 한 번만: tz-aware now() 1회 + strftime 1회를
+            # 로컬에 바인딩하고, 로그의 HH:MM:SS는 슬라이스로 재사용합니다.
+            # (월/일요일 스킵은 calculate_next_target_time이 처리하므로
+            #  여기서는 요일을 다시 확인하지 않습니다.)
             current_kst = datetime.now(KST_TZ)
-            status['last_check_time_kst'] = current_kst.strftime("%Y-%m-%d %H:%M:%S KST")
-            
-            # Output schedule check log every minute at WARNING level.
-            logger.warning(f"Monitor: Checking schedule (KST: {current_kst.strftime('%H:%M:%S')}).")
-            
-            # Check send condition (once per day, at the specified time)
-            target_date_kst = next_target_time_kst.strftime("%Y-%m-%d")
+            formatted_kst = current_kst.strftime("%Y-%m-%d %H:%M:%S KST")
+            status.last_check_time_kst = formatted_kst
 
-            # Logic: Added day of week check (Monday=0, Sunday=6)
-            is_monday_or_sunday = (current_kst.weekday() == 0) or (current_kst.weekday() == 6)
+            if target_date_kst != status.last_sent_date_kst:
+                logger.info("⏰ Send time reached (KST: %s). Executing job.", formatted_kst[11:19])
 
-            if current_kst >= next_target_time_kst and \
-               current_kst < next_target_time_kst + timedelta(minutes=1) and \
-               target_date_kst != status['last_sent_date_kst']:
+                # Execute send logic
+                await run_and_send_plot()
 
-                if is_monday_or_sunday:
-                    # If it's Monday (0) or Sunday (6), skip sending
-                    logger.info(f"🚫 Skip send: Today is Monday or Sunday (KST). Only updating next scheduled time.")
-                else:
-                    logger.info(f"⏰ Send time reached (KST: {current_kst.strftime('%H:%M:%S')}). Executing job.")
-                    
-                    # Execute send logic
-                    await run_and_send_plot()
-                
-                # Update the next target time (regardless of send success)
-                # ⭐️ DST를 다시 체크하여 다음 날짜의 목표 시간을 계산합니다.
-                next_target_time_kst = calculate_next_target_time(current_kst)
-                status['next_scheduled_time_kst'] = next_target_time_kst.strftime("%Y-%m-%d %H:%M:%S KST")
-                logger.info(f"➡️ Next scheduled time (KST): {status['next_scheduled_time_kst']}")
-                
-            elif current_kst.day != next_target_time_kst.day and \
-                 current_kst.hour > BASE_TARGET_HOUR_KST + 1: # ⭐️ [수정] BASE 시간을 기준으로 체크
-                # Catch-up logic for missed target time (e.g., right after server restart)
-                # ⭐️ DST를 다시 체크하여 현재 날짜의 목표 시간을 계산합니다.
-                next_target_time_kst = calculate_next_target_time(current_kst)
-                status['next_scheduled_time_kst'] = next_target_time_kst.strftime("%Y-%m-%d %H:%M:%S KST")
+            # Update the next target time (regardless of send success)
+            # ⭐️ DST를 다시 체크하여 다음 날짜의 목표 시간을 계산합니다.
+            next_target_time_kst = calculate_next_target_time(datetime.now(KST_TZ))
+            next_target_epoch = next_target_time_kst.timestamp()
+            next_target_str = next_target_time_kst.strftime("%Y-%m-%d %H:%M:%S KST")
+            target_date_kst = next_target_time_kst.date()
+            status.next_scheduled_time_kst = next_target_str
+            logger.info("➡️ Next scheduled time (KST): %s", status.next_scheduled_time_kst)
 
         except Exception as e:
             # If any unhandled exception occurs in the main loop logic, log it and continue to the next iteration
-            logger.error(f"⚠️ Major exception in main monitor loop. Continuing after 60s: {e}", exc_info=True)
+            logger.error("⚠️ Major exception in main monitor loop. Continuing after 60s: %s", e, exc_info=True)
+            await asyncio.sleep(60)
 
 
 async def self_ping_loop():
     """
-    [Internal Sleep Prevention] Loop that internally pings its own Health Check endpoint every 5 minutes.
+    [Internal Sleep Prevention] Loop that internally pings its own Health Check endpoint every SELF_PING_INTERVAL seconds.
+
+    ⚠️ 주의: 이 핑은 프로세스 내부 루프백 트래픽이라 Render의 외부 유휴
+    감지에는 영향을 주지 못합니다. 기본적으로 꺼져 있으며(ENABLE_SELF_PING),
+    외부 keepalive가 공개 URL을 호출하도록 구성하는 것을 권장합니다.
     """
     global status
     # Request to its own IP/Port inside Render
-    ping_url = f"http://127.0.0.1:{SERVER_PORT}/" 
-    logger.info(f"🛡️ Starting internal self-ping loop. Requesting {ping_url} every 5 minutes.")
-    
-    async with aiohttp.ClientSession() as session:
-        while True:
-            await asyncio.sleep(5 * 60) # Wait 5 minutes
-            
+    logger.info("🛡️ Starting internal self-ping loop. HEAD 127.0.0.1:%d every %ds.", SERVER_PORT, SELF_PING_INTERVAL)
+
+    # ⭐️ [수정] 루프백 생존 확인에 aiohttp 세션/파서는 과함: raw TCP로
+    # HEAD 한 줄을 쓰고 상태줄만 읽습니다. (요청/응답 객체 할당 없음)
+    ping_request = f"HEAD / HTTP/1.0\r\nHost: 127.0.0.1:{SERVER_PORT}\r\n\r\n".encode()
+    while True:
+        await asyncio.sleep(SELF_PING_INTERVAL)
+
+        try:
+            reader, writer = await asyncio.wait_for(
+                asyncio.open_connection("127.0.0.1", SERVER_PORT), timeout=10)
             try:
-                # Use HEAD request as it is the lightest check
-                async with session.head(ping_url, timeout=10) as response:
-                    # A 200 OK status indicates the server is alive and responded to HEAD
-                    if response.status == 200:
-                        status['last_self_ping_kst'] = datetime.now(KST_TZ).strftime("%Y-%m-%d %H:%M:%S KST")
-                        logger.debug(f"✅ Self-ping successful: {status['last_self_ping_kst']}")
-                    else:
-                        logger.warning(f"❌ Self-ping failed (Status: {response.status})")
-                        
-            except Exception as e:
-                logger.error(f"❌ Exception during self-ping: {e}")
+                writer.write(ping_request)
+                await writer.drain()
+                status_line = await asyncio.wait_for(reader.read(64), timeout=10)
+            finally:
+                writer.close()
+                await writer.wait_closed()
+
+            # A 200 OK status line indicates the server is alive and responded to HEAD
+            if b" 200 " in status_line[:16]:
+                status.last_self_ping_kst = kst_now_str()
+                logger.debug("✅ Self-ping successful: %s", status.last_self_ping_kst)
+            else:
+                logger.warning("❌ Self-ping failed (Response: %r)", status_line[:32])
+
+        except Exception as e:
+            logger.error("❌ Exception during self-ping: %s", e)
 
 
 # =========================================================
@@ -747,53 +1233,95 @@ async def self_ping_loop():
 app = FastAPI(
     title="VIX Plot Telegram Scheduler",
     description="VIX/S&P 500 Chart Sender running on Render Free Tier.",
-    version="1.0.0"
+    version="1.0.0",
+    # Serialize JSON endpoints with orjson instead of stdlib json
+    default_response_class=ORJSONResponse
 )
 
+# ⭐️ [수정] 대시보드 CSS는 /static/app.css로 분리 (매 요청마다 ~3KB 재전송 방지)
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "static")
+app.mount("/static", StaticFiles(directory=STATIC_DIR), name="static")
+
+# ⭐️ [신규] readiness gate: startup이 백그라운드 태스크를 모두 걸어두기 전에
+# /set-time이 들어오면 500 대신 깔끔한 503을 돌려줍니다. (준비 후엔 비용 0에 가까움)
+ready_event = asyncio.Event()
+
+
+@app.middleware("http")
+async def readiness_gate(request: Request, call_next):
+    """서비스 준비 전의 상태 변경 요청(/set-time)을 503으로 차단합니다."""
+    if request.url.path.startswith("/set-time") and not ready_event.is_set():
+        return ORJSONResponse({"ready": False}, status_code=503)
+    return await call_next(request)
+
+
+@app.middleware("http")
+async def static_cache_headers(request: Request, call_next):
+    """Adds a far-future Cache-Control header to static assets so browsers
+    (and any proxy) only download the CSS once."""
+    response = await call_next(request)
+    if request.url.path.startswith("/static/"):
+        response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+    return response
+
 # Start background task upon server startup
 @app.on_event("startup")
 async def startup_event():
     """Starts the scheduler loop and self-ping loop in the background upon server startup."""
+    # ⭐️ 공유 HTTP 세션을 미리 생성하고 Daum 쿠키를 1회 확보 ⭐️
+    session = await _get_http_session()
+    asyncio.create_task(_ensure_daum_cookies(session))
+    # ⭐️ 금 시세 캐시를 백그라운드에서 미리 채움: 첫 전송이 네트워크 왕복을
+    # 기다리지 않고, 이후 갱신은 TTL 캐시(1시간)가 담당합니다.
+    asyncio.create_task(get_gold_metrics_cached())
+    # ⭐️ 렌더 워커 프로세스 + matplotlib 폰트 캐시 예열 (백그라운드)
+    asyncio.create_task(_warm_plot_worker())
     # Main scheduling loop
-    asyncio.create_task(main_monitor_loop()) 
-    # Auxiliary self-ping loop for sleep prevention
-    asyncio.create_task(self_ping_loop())    
-    logger.info("🚀 Background scheduling and self-ping loops have started.")
+    asyncio.create_task(main_monitor_loop())
+    # Auxiliary self-ping loop (opt-in; loopback pings don't reach Render's idle detection)
+    if ENABLE_SELF_PING:
+        asyncio.create_task(self_ping_loop())
+    # ⭐️ 백그라운드 태스크가 모두 스케줄된 뒤 readiness gate 해제
+    ready_event.set()
+    logger.info("🚀 Background scheduling loop has started.")
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Closes the shared HTTP session and plot worker pool upon server shutdown."""
+    await close_http_session()
+    if PLOT_POOL is not None:
+        PLOT_POOL.shutdown(wait=False, cancel_futures=True)
 
 # ---------------------------------------------------------
 # New Endpoint: Set Scheduling Time
 # ---------------------------------------------------------
 @app.post("/set-time")
 async def set_schedule_time(
-    hour: str = Form(...), 
-    minute: str = Form(...) 
+    # ⭐️ [수정] 수동 int()/범위 검사 대신 타입 지정 Form 검증:
+    # 변환·검증은 Pydantic이 처리하고 잘못된 입력은 422로 반환됩니다.
+    hour: int = Form(..., ge=0, le=23),
+    minute: int = Form(..., ge=0, le=59),
 ):
     """Saves the KST time entered by the user and updates the next scheduled time."""
     # ⭐️ [수정] BASE (기준) 변수를 업데이트하도록 변경
     global BASE_TARGET_HOUR_KST, BASE_TARGET_MINUTE_KST
     global status
 
-    try:
-        hour_int = int(hour)
-        minute_int = int(minute)
-    except ValueError:
-        raise HTTPException(status_code=400, detail="Hour and minute must be integers.")
-        
-    # Validation check
-    if not (0 <= hour_int <= 23 and 0 <= minute_int <= 59):
-        raise HTTPException(status_code=400, detail="Hour must be 0-23 and minute 0-59.")
-
     # ⭐️ [수정] 글로벌 변수 대신 BASE 변수를 업데이트
-    BASE_TARGET_HOUR_KST = hour_int
-    BASE_TARGET_MINUTE_KST = minute_int
+    BASE_TARGET_HOUR_KST = hour
+    BASE_TARGET_MINUTE_KST = minute
     
     # ⭐️ Recalculate next send time immediately ⭐️
     now_kst = datetime.now(KST_TZ)
     # ⭐️ 이제 이 함수는 DST를 정확히 반영합니다.
     next_target_time_kst = calculate_next_target_time(now_kst)
-    status['next_scheduled_time_kst'] = next_target_time_kst.strftime("%Y-%m-%d %H:%M:%S KST")
+    status.next_scheduled_time_kst = next_target_time_kst.strftime("%Y-%m-%d %H:%M:%S KST")
+
+    # ⭐️ 자고 있는 스케줄러 루프를 깨워 새 기준 시각을 반영
+    _schedule_changed.set()
 
-    logger.info(f"⏰ New send time set to KST {BASE_TARGET_HOUR_KST:02d}:{BASE_TARGET_MINUTE_KST:02d} (Base). Next run: {status['next_scheduled_time_kst']}")
+    logger.info("⏰ New send time set to KST %02d:%02d (Base). Next run: %s", BASE_TARGET_HOUR_KST, BASE_TARGET_MINUTE_KST, status.next_scheduled_time_kst)
     
     # Redirect back to the status page
     return RedirectResponse(url="/", status_code=303)
@@ -802,90 +1330,103 @@ async def set_schedule_time(
 # ---------------------------------------------------------
 # Root Endpoint (Status Dashboard) - Now allows GET and HEAD
 # ---------------------------------------------------------
-@app.api_route("/", methods=["GET", "HEAD"], response_class=HTMLResponse)
-async def home_status(request: Request):
-    """Simple status dashboard with an option to change the schedule time.
-    Allows both GET (for browser) and HEAD (for health check/ping)."""
-    global status
-    
-    # If the request is a HEAD request, just return a 200 OK without content.
-    if request.method == "HEAD":
-        return HTMLResponse(status_code=200)
-
-    # For GET requests, return the full status page.
-    
-    # Check if necessary environment variables are set
-    config_warning = ""
-    if 'YOUR_BOT_TOKEN_HERE' in TELEGRAM_BOT_TOKEN:
-        config_warning += "<li>⚠️ **TELEGRAM_BOT_TOKEN** is using the default placeholder. Sending is disabled.</li>"
-    if TELEGRAM_TARGET_CHAT_ID == '-1000000000':
-        config_warning += "<li>⚠️ **TELEGRAM_TARGET_CHAT_ID** is using the default placeholder. Sending is disabled.</li>"
-    
-    # Calculate current KST
-    current_kst = datetime.now(KST_TZ).strftime("%Y-%m-%d %H:%M:%S KST")
-    
-    # ⭐️ [수정] 폼에는 BASE 시간을 표시 (사용자가 설정한 시간)
-    current_hour = BASE_TARGET_HOUR_KST
-    current_minute = BASE_TARGET_MINUTE_KST
-
-    html_content = f"""
+# ⭐️ [수정] 요청마다 ~3KB HTML 전체를 f-string으로 재조립하지 않도록,
+# 정적 마크업은 모듈 로드 시 UTF-8 bytes로 1회 인코딩해 두고
+# 요청 시에는 동적 필드만 %-보간합니다. (Response가 str→bytes 인코딩을
+# 다시 할 필요도 없음)
+_HOME_TEMPLATE = """
     <!DOCTYPE html>
     <html lang="ko">
     <head>
         <meta charset="UTF-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
         <title>VIX 모니터링 서비스 상태</title>
-        <style>
-            body {{ font-family: 'Arial', sans-serif; background-color: #f4f7f9; color: #333; margin: 0; padding: 20px; }}
-            .container {{ max-width: 800px; margin: 0 auto; background: #ffffff; padding: 25px; border-radius: 12px; box-shadow: 0 4px 8px rgba(0,0,0,0.1); }}
-            h1 {{ color: #0056b3; border-bottom: 3px solid #0056b3; padding-bottom: 10px; margin-top: 0; }}
-            h2 {{ color: #007bff; margin-top: 20px; }}
-            .status-box {{ background-color: #e9f7ff; border: 1px solid #b3e0ff; padding: 15px; border-radius: 8px; margin-bottom: 20px; }}
-            .status-box p {{ margin: 5px 0; font-size: 1.1em; }}
-            .status-box strong {{ color: #333; display: inline-block; width: 150px; }}
-            .warning {{ background-color: #ffe0e0; border-left: 5px solid #ff4d4d; padding: 10px; margin-top: 15px; border-radius: 5px; }}
-            form {{ background-color: #f9f9f9; padding: 20px; border-radius: 8px; border: 1px solid #ddd; }}
-            label {{ display: block; margin-bottom: 5px; font-weight: bold; color: #555; }}
-            input[type="number"] {{ width: 80px; padding: 8px; margin-right: 10px; border: 1px solid #ccc; border-radius: 4px; }}
-            button {{ background-color: #28a745; color: white; padding: 10px 20px; border: none; border-radius: 4px; cursor: pointer; font-size: 1em; margin-top: 10px; }}
-            button:hover {{ background-color: #218838; }}
-        </style>
+        <link rel="stylesheet" href="/static/app.css">
     </head>
     <body>
         <div class="container">
             <h1>VIX/S&P 500 차트 스케줄러 상태</h1>
-            
+
             <h2>현재 설정 및 상태</h2>
             <div class="status-box">
-                <p><strong>현재 KST 시간:</strong> {current_kst}</p>
-                <p><strong>다음 전송 시각 (KST):</strong> {status['next_scheduled_time_kst']}</p>
-                <p><strong>마지막 전송일:</strong> {status['last_sent_date_kst']}</p>
-                <p><strong>마지막 확인 시각:</strong> {status['last_check_time_kst']}</p>
-                <p><strong>마지막 자체 핑:</strong> {status['last_self_ping_kst']}</p>
-                <p><strong>설정된 기준 시간 (KST):</strong> {current_hour:02d}:{current_minute:02d}</p>
+                <p><strong>현재 KST 시간:</strong> %(current_kst)s</p>
+                <p><strong>다음 전송 시각 (KST):</strong> %(next_scheduled)s</p>
+                <p><strong>마지막 전송일:</strong> %(last_sent)s</p>
+                <p><strong>마지막 확인 시각:</strong> %(last_check)s</p>
+                <p><strong>마지막 자체 핑:</strong> %(last_ping)s</p>
+                <p><strong>설정된 기준 시간 (KST):</strong> %(base_time)s</p>
             </div>
 
-            {f'<div class="warning"><h3>설정 경고</h3><ul>{config_warning}</ul></div>' if config_warning else ''}
-            
+            %(warning_block)s
+
             <h2>전송 기준 시간 변경 (KST, Non-DST)</h2>
             <form method="POST" action="/set-time">
                 <label for="hour">시 (0-23):</label>
-                <input type="number" id="hour" name="hour" value="{current_hour}" min="0" max="23" required>
-                
+                <input type="number" id="hour" name="hour" value="%(hour)s" min="0" max="23" required>
+
                 <label for="minute">분 (0-59):</label>
-                <input type="number" id="minute" name="minute" value="{current_minute}" min="0" max="59" required>
-                
+                <input type="number" id="minute" name="minute" value="%(minute)s" min="0" max="59" required>
+
                 <button type="submit">전송 시간 업데이트</button>
             </form>
-            
+
             <p style="margin-top: 20px; font-size: 0.9em; color: #666;">
                 *이 서비스는 매일 한 번, 설정된 KST 기준 시간에 맞춰 텔레그램으로 VIX 및 S&P 500 차트를 전송합니다. (썸머타임 자동 적용)
             </p>
         </div>
     </body>
     </html>
-    """
-    return HTMLResponse(content=html_content, status_code=200)
+    """.encode("utf-8")
+
+
+# ⭐️ [수정] 토큰/챗ID는 프로세스 시작 시 고정이므로 경고 블록도 import 시 1회
+# 조립해 bytes로 보관합니다 (요청마다 'in' 검사 + <li> 조립 불필요).
+def _build_config_warning() -> bytes:
+    items = ""
+    if 'YOUR_BOT_TOKEN_HERE' in TELEGRAM_BOT_TOKEN:
+        items += "<li>⚠️ **TELEGRAM_BOT_TOKEN** is using the default placeholder. Sending is disabled.</li>"
+    if TELEGRAM_TARGET_CHAT_ID == '-1000000000':
+        items += "<li>⚠️ **TELEGRAM_TARGET_CHAT_ID** is using the default placeholder. Sending is disabled.</li>"
+    if not items:
+        return b''
+    return f'<div class="warning"><h3>설정 경고</h3><ul>{items}</ul></div>'.encode()
+
+
+_CONFIG_WARNING_HTML = _build_config_warning()
+
+
+# ⭐️ [수정] 헬스체크용 HEAD는 전용 핸들러로 분리: 상태 페이지 로직/템플릿
+# substitute를 전혀 거치지 않고 빈 200 Response만 반환합니다.
+@app.head("/")
+async def home_head():
+    """Health check/ping용 HEAD 요청에 본문 없는 200을 반환합니다."""
+    return Response(status_code=200)
+
+
+@app.get("/", response_class=HTMLResponse)
+async def home_status():
+    """Simple status dashboard with an option to change the schedule time."""
+    global status
+
+    # Calculate current KST (1-second cached)
+    current_kst = kst_now_str()
+
+    # ⭐️ [수정] 폼에는 BASE 시간을 표시 (사용자가 설정한 시간)
+    current_hour = BASE_TARGET_HOUR_KST
+    current_minute = BASE_TARGET_MINUTE_KST
+
+    body = _HOME_TEMPLATE % {
+        b'current_kst': current_kst.encode(),
+        b'next_scheduled': status.next_scheduled_time_kst.encode(),
+        b'last_sent': str(status.last_sent_date_kst).encode(),
+        b'last_check': status.last_check_time_kst.encode(),
+        b'last_ping': status.last_self_ping_kst.encode(),
+        b'base_time': f"{current_hour:02d}:{current_minute:02d}".encode(),
+        b'warning_block': _CONFIG_WARNING_HTML,
+        b'hour': str(current_hour).encode(),
+        b'minute': str(current_minute).encode(),
+    }
+    return Response(content=body, media_type="text/html")
 
 if __name__ == "__main__":
     # If running locally (not via uvicorn/gunicorn, which Render typically uses)